@@ -5,7 +5,7 @@ from sqlalchemy import engine_from_config, pool
 
 from app.config import get_settings
 from app.database import Base
-from app.models import Admin, Booking, Sponsor
+from app.models import Admin, AuditEvent, Booking, Sponsor
 
 config = context.config
 settings = get_settings()
@@ -0,0 +1,38 @@
+"""audit events
+
+Revision ID: 0002_audit_events
+Revises: 0001_initial
+Create Date: 2026-10-19 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002_audit_events"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_events",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("action", sa.String(length=50), nullable=False),
+        sa.Column("actor", sa.String(length=100), nullable=True),
+        sa.Column("client_address", sa.String(length=64), nullable=True),
+        sa.Column("entity_type", sa.String(length=50), nullable=True),
+        sa.Column("entity_id", sa.Integer(), nullable=True),
+        sa.Column("details", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_audit_events_action_id", "audit_events", ["action", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_events_action_id", table_name="audit_events")
+    op.drop_table("audit_events")
@@ -0,0 +1,211 @@
+"""Batched, asynchronous audit log of admin and booking mutations."""
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy.exc import InterfaceError, OperationalError, StatementError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import models
+from app.config import get_settings
+from app.crud.audit_crud import AuditCRUD
+from app.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_DELAY_SECONDS = 30.0
+# Upper bound on how long the writer waits before noticing stop().
+STOP_POLL_SECONDS = 0.1
+# Connection-level failures: keep the batch and retry instead of dropping rows.
+TRANSIENT_ERRORS = (OperationalError, InterfaceError)
+
+_columns = models.AuditEvent.__table__.c
+ACTION_MAX_LENGTH = _columns.action.type.length
+ACTOR_MAX_LENGTH = _columns.actor.type.length
+CLIENT_ADDRESS_MAX_LENGTH = _columns.client_address.type.length
+ENTITY_TYPE_MAX_LENGTH = _columns.entity_type.type.length
+
+
+def _truncate(value: str | None, max_length: int) -> str | None:
+    return value[:max_length] if value is not None else None
+
+
+class AuditLog:
+    """Bounded in-memory queue flushed to ``audit_events`` by a worker thread.
+
+    Events are written in multi-row inserts once ``batch_size`` events are
+    queued or ``flush_interval`` seconds have passed. When the queue is full,
+    new events are dropped rather than blocking the request; the count is
+    logged on the next flush. While the database is unreachable the current
+    batch is retried with backoff and new events keep queueing.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=max_queue_size)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def record(
+        self,
+        action: str,
+        *,
+        actor: str | None = None,
+        client_address: str | None = None,
+        entity_type: str | None = None,
+        entity_id: int | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        """Enqueue an event without touching the database."""
+
+        # Truncate up front so one oversized value cannot fail a whole batch.
+        event = {
+            "action": _truncate(action, ACTION_MAX_LENGTH),
+            "actor": _truncate(actor, ACTOR_MAX_LENGTH),
+            "client_address": _truncate(client_address, CLIENT_ADDRESS_MAX_LENGTH),
+            "entity_type": _truncate(entity_type, ENTITY_TYPE_MAX_LENGTH),
+            "entity_id": entity_id,
+            "details": details,
+            "created_at": datetime.now(timezone.utc),
+        }
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def start(self) -> None:
+        """Start the background writer."""
+
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the writer after flushing queued events, waiting at most ``timeout``."""
+
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.error(
+                "Audit writer did not finish within %ss; %d events still queued",
+                timeout,
+                self._queue.qsize(),
+            )
+        self._thread = None
+        self._report_dropped()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                self._write(self._collect(time.monotonic() + self.flush_interval))
+                self._report_dropped()
+            except Exception:
+                logger.exception("Audit writer failed to flush a batch")
+
+        while batch := self._drain():
+            try:
+                self._write(batch)
+            except Exception:
+                logger.exception("Audit writer failed to flush a batch")
+
+    def _collect(self, deadline: float) -> list[dict[str, Any]]:
+        batch: list[dict[str, Any]] = []
+        while len(batch) < self.batch_size and not self._stopping.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=min(remaining, STOP_POLL_SECONDS)))
+            except queue.Empty:
+                continue
+        return batch
+
+    def _drain(self) -> list[dict[str, Any]]:
+        batch: list[dict[str, Any]] = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        delay = self.flush_interval
+        while batch:
+            try:
+                self._flush(batch)
+            except TRANSIENT_ERRORS as exc:
+                if self._stopping.is_set():
+                    logger.error(
+                        "Database unavailable at shutdown, dropped %d audit events: %s",
+                        len(batch),
+                        exc,
+                    )
+                    return
+                logger.warning("Audit insert failed, retrying in %.1fs: %s", delay, exc)
+                self._stopping.wait(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY_SECONDS)
+
+    def _flush(self, batch: list[dict[str, Any]]) -> None:
+        """Insert ``batch``, removing events from it as they are written or dropped.
+
+        Connection failures propagate with the unwritten events left in ``batch``.
+        """
+
+        db = self.session_factory()
+        try:
+            try:
+                AuditCRUD.bulk_create(db, batch)
+                batch.clear()
+            except TRANSIENT_ERRORS:
+                raise
+            except StatementError as exc:
+                logger.warning("Batch audit insert failed, retrying row by row: %s", exc)
+                self._flush_rows(db, batch)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _flush_rows(db: Session, batch: list[dict[str, Any]]) -> None:
+        while batch:
+            try:
+                AuditCRUD.bulk_create(db, batch[:1])
+            except TRANSIENT_ERRORS:
+                raise
+            except StatementError as exc:
+                logger.error("Dropped audit event %s: %s", batch[0]["action"], exc)
+            del batch[0]
+
+    def _report_dropped(self) -> None:
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            logger.warning("Audit queue full, dropped %d events", dropped)
+
+
+settings = get_settings()
+
+audit_log = AuditLog(
+    SessionLocal,
+    max_queue_size=settings.audit_queue_size,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_seconds,
+)
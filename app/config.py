@@ -1,6 +1,8 @@
 """Application configuration module."""
 from functools import lru_cache
+from typing import Literal
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,6 +15,26 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     cors_origins: list[str] = ["*"]
 
+    rate_limit_enabled: bool = True
+    rate_limit_backend: Literal["memory", "redis"] = "memory"
+    rate_limit_redis_url: str = "redis://localhost:6379/0"
+    rate_limit_max_buckets: int = Field(10_000, ge=1)
+    rate_limit_trust_forwarded_for: bool = False
+    rate_limit_trusted_proxy_hops: int = Field(1, ge=1)
+    rate_limit_login_per_minute: float = Field(10, gt=0)
+    rate_limit_login_burst: int = Field(5, ge=1)
+    rate_limit_write_per_minute: float = Field(60, gt=0)
+    rate_limit_write_burst: int = Field(20, ge=1)
+    rate_limit_read_per_minute: float = Field(300, gt=0)
+    rate_limit_read_burst: int = Field(60, ge=1)
+    # 0 disables load shedding.
+    max_concurrent_requests: int = Field(32, ge=0)
+
+    audit_queue_size: int = Field(10_000, ge=1)
+    audit_batch_size: int = Field(200, ge=1)
+    audit_flush_interval_seconds: float = Field(1.0, gt=0)
+    audit_shutdown_timeout_seconds: float = Field(10.0, gt=0)
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -0,0 +1,34 @@
+"""CRUD operations for audit events."""
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app import models
+
+
+class AuditCRUD:
+    """Audit event CRUD methods."""
+
+    @staticmethod
+    def bulk_create(db: Session, events: list[dict]) -> None:
+        try:
+            db.execute(insert(models.AuditEvent), events)
+            db.commit()
+        except SQLAlchemyError as exc:
+            db.rollback()
+            raise exc
+
+    @staticmethod
+    def list_page(
+        db: Session, limit: int, before_id: int | None = None, action: str | None = None
+    ) -> tuple[list[models.AuditEvent], int | None]:
+        stmt = select(models.AuditEvent).order_by(models.AuditEvent.id.desc())
+        if before_id is not None:
+            stmt = stmt.where(models.AuditEvent.id < before_id)
+        if action is not None:
+            stmt = stmt.where(models.AuditEvent.action == action)
+        events = list(db.execute(stmt.limit(limit + 1)).scalars())
+        if len(events) > limit:
+            events = events[:limit]
+            return events, events[-1].id
+        return events, None
@@ -6,13 +6,16 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.audit import audit_log
 
 
 class BookingCRUD:
     """Booking CRUD methods."""
 
     @staticmethod
-    def create(db: Session, payload: schemas.BookingCreate) -> models.Booking:
+    def create(
+        db: Session, payload: schemas.BookingCreate, client_address: str | None = None
+    ) -> models.Booking:
         booking = models.Booking(**payload.model_dump())
         try:
             db.add(booking)
@@ -24,6 +27,16 @@ class BookingCRUD:
         except SQLAlchemyError as exc:
             db.rollback()
             raise exc
+        audit_log.record(
+            "booking.create",
+            client_address=client_address,
+            entity_type="booking",
+            entity_id=booking.id,
+            details={
+                "sponsor_id": booking.sponsor_id,
+                "booking_date": booking.booking_date.isoformat(),
+            },
+        )
         return booking
 
     @staticmethod
@@ -34,34 +47,47 @@ class BookingCRUD:
     @staticmethod
     def get_monthly_schedule(
         db: Session, month: int, year: int
-    ) -> list[schemas.BookingScheduleItem]:
+    ) -> list[schemas.BookingScheduleRow]:
         stmt = (
-            select(models.Booking, models.Sponsor.full_name)
+            select(
+                models.Booking.booking_date,
+                models.Sponsor.full_name.label("sponsor_name"),
+                models.Booking.food_note,
+                models.Booking.status,
+            )
             .join(models.Sponsor, models.Sponsor.id == models.Booking.sponsor_id)
             .where(extract("month", models.Booking.booking_date) == month)
             .where(extract("year", models.Booking.booking_date) == year)
             .order_by(models.Booking.booking_date.asc())
         )
-        rows = db.execute(stmt).all()
-        return [
-            schemas.BookingScheduleItem(
-                booking_date=booking.booking_date,
-                sponsor_name=full_name,
-                food_note=booking.food_note,
-                status=booking.status,
-            )
-            for booking, full_name in rows
-        ]
+        return [dict(row) for row in db.execute(stmt).mappings()]
 
     @staticmethod
-    def delete(db: Session, booking_id: int) -> bool:
+    def delete(
+        db: Session,
+        booking_id: int,
+        actor: str | None = None,
+        client_address: str | None = None,
+    ) -> bool:
         booking = db.get(models.Booking, booking_id)
         if not booking:
             return False
+        details = {
+            "sponsor_id": booking.sponsor_id,
+            "booking_date": booking.booking_date.isoformat(),
+        }
         try:
             db.delete(booking)
             db.commit()
         except SQLAlchemyError as exc:
             db.rollback()
             raise exc
+        audit_log.record(
+            "booking.delete",
+            actor=actor,
+            client_address=client_address,
+            entity_type="booking",
+            entity_id=booking_id,
+            details=details,
+        )
         return True
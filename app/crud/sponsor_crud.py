@@ -3,13 +3,16 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.audit import audit_log
 
 
 class SponsorCRUD:
     """Sponsor CRUD methods."""
 
     @staticmethod
-    def create(db: Session, payload: schemas.SponsorCreate) -> models.Sponsor:
+    def create(
+        db: Session, payload: schemas.SponsorCreate, client_address: str | None = None
+    ) -> models.Sponsor:
         sponsor = models.Sponsor(**payload.model_dump())
         try:
             db.add(sponsor)
@@ -18,6 +21,12 @@ class SponsorCRUD:
         except SQLAlchemyError as exc:
             db.rollback()
             raise exc
+        audit_log.record(
+            "sponsor.create",
+            client_address=client_address,
+            entity_type="sponsor",
+            entity_id=sponsor.id,
+        )
         return sponsor
 
     @staticmethod
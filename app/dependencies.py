@@ -1,11 +1,13 @@
 """Common dependencies for routes."""
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.database import SessionLocal
 from app.auth.jwt_handler import decode_access_token
 from app.crud.admin_crud import AdminCRUD
+from app.rate_limit import client_ip, trusted_proxy_hops
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/admin/login")
 
@@ -20,6 +22,12 @@ def get_db():
         db.close()
 
 
+def get_client_address(request: Request) -> str:
+    """Return the client address, honouring trusted proxy headers."""
+
+    return client_ip(request.scope, trusted_proxy_hops(get_settings()))
+
+
 def get_current_admin(
     token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
 ):
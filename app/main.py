@@ -1,14 +1,17 @@
 """FastAPI entrypoint for Masjid Ustad Daily Food Sponsorship System."""
 import logging
-
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
 
+from app.audit import audit_log
 from app.config import get_settings
+from app.rate_limit import RateLimitMiddleware, build_bucket_store
 from app.routers.admin_routes import router as admin_router
 from app.routers.booking_routes import router as booking_router
 from app.routers.sponsor_routes import router as sponsor_router
@@ -19,8 +22,26 @@ logging.basicConfig(
 )
 
 settings = get_settings()
-app = FastAPI(title="Masjid Ustad Daily Food Sponsorship System", version="1.0.0")
+# Built here rather than lazily by Starlette so a misconfigured backend fails at startup.
+rate_limit_store = build_bucket_store(settings)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Run the audit writer for the lifetime of the app and drain it on shutdown."""
+
+    audit_log.start()
+    yield
+    await run_in_threadpool(audit_log.stop, settings.audit_shutdown_timeout_seconds)
+    await rate_limit_store.close()
+
+
+app = FastAPI(
+    title="Masjid Ustad Daily Food Sponsorship System", version="1.0.0", lifespan=lifespan
+)
 
+# Added before CORS so that 429/503 responses still carry CORS headers.
+app.add_middleware(RateLimitMiddleware, settings=settings, store=rate_limit_store)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
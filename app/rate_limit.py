@@ -0,0 +1,273 @@
+"""Token-bucket rate limiting and load shedding middleware."""
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+LOGIN_PATH = "/admin/login"
+EXEMPT_PATHS = frozenset({"/health"})
+EXEMPT_PREFIXES = ("/static",)
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+STORE_WARNING_INTERVAL_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class BucketPolicy:
+    """Refill rate and burst capacity for one route class."""
+
+    rate_per_second: float
+    capacity: int
+
+
+class BucketStore(ABC):
+    """Storage backend for token bucket state."""
+
+    @abstractmethod
+    async def consume(self, key: str, policy: BucketPolicy) -> float:
+        """Take one token from ``key``; return 0 if allowed, else seconds to wait."""
+
+    async def close(self) -> None:
+        """Release any connections held by the store."""
+
+
+class MemoryBucketStore(BucketStore):
+    """Per-process bucket store bounded to ``max_buckets`` entries (LRU eviction)."""
+
+    def __init__(self, max_buckets: int):
+        self.max_buckets = max_buckets
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consume(self, key: str, policy: BucketPolicy) -> float:
+        # Runs on the event loop without awaiting, so no lock is needed.
+        now = time.monotonic()
+        state = self._buckets.get(key)
+        if state is None:
+            tokens = float(policy.capacity)
+        else:
+            tokens, updated_at = state
+            tokens = min(
+                float(policy.capacity),
+                tokens + (now - updated_at) * policy.rate_per_second,
+            )
+            self._buckets.move_to_end(key)
+
+        if tokens >= 1:
+            tokens -= 1
+            wait = 0.0
+        else:
+            wait = (1 - tokens) / policy.rate_per_second
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_buckets:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+_REDIS_TOKEN_BUCKET = """
+local state = redis.call('HMGET', KEYS[1], 't', 'u')
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local tokens = tonumber(state[1])
+if tokens == nil then
+    tokens = capacity
+else
+    tokens = math.min(capacity, tokens + (now - tonumber(state[2])) * rate)
+end
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 't', tokens, 'u', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisBucketStore(BucketStore):
+    """Bucket store shared across workers; idle buckets expire once full again."""
+
+    def __init__(self, url: str):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:
+            raise RuntimeError(
+                "rate_limit_backend='redis' requires the 'redis' package"
+            ) from exc
+
+        self._client = redis_asyncio.from_url(url)
+        self._script = self._client.register_script(_REDIS_TOKEN_BUCKET)
+        self._next_warning_at = 0.0
+        self._suppressed_warnings = 0
+
+    async def consume(self, key: str, policy: BucketPolicy) -> float:
+        try:
+            wait = await self._script(
+                keys=[f"ratelimit:{key}"],
+                args=[policy.rate_per_second, policy.capacity],
+            )
+        except Exception as exc:
+            # Fail open so a store outage does not take the API down with it.
+            self._warn_unavailable(exc)
+            return 0.0
+        return float(wait)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def _warn_unavailable(self, exc: Exception) -> None:
+        # Log at most once per interval; an outage fails every request.
+        now = time.monotonic()
+        if now < self._next_warning_at:
+            self._suppressed_warnings += 1
+            return
+        logger.warning(
+            "Rate limit store unavailable (%d similar warnings suppressed): %s",
+            self._suppressed_warnings,
+            exc,
+        )
+        self._suppressed_warnings = 0
+        self._next_warning_at = now + STORE_WARNING_INTERVAL_SECONDS
+
+
+def build_bucket_store(settings: Settings) -> BucketStore:
+    """Create the bucket store selected by ``settings.rate_limit_backend``."""
+
+    if settings.rate_limit_backend == "memory":
+        return MemoryBucketStore(settings.rate_limit_max_buckets)
+    if settings.rate_limit_backend == "redis":
+        return RedisBucketStore(settings.rate_limit_redis_url)
+    raise ValueError(f"Unknown rate limit backend: {settings.rate_limit_backend}")
+
+
+def build_policies(settings: Settings) -> dict[str, BucketPolicy]:
+    """Return bucket policies keyed by route class."""
+
+    return {
+        "login": BucketPolicy(
+            settings.rate_limit_login_per_minute / 60, settings.rate_limit_login_burst
+        ),
+        "write": BucketPolicy(
+            settings.rate_limit_write_per_minute / 60, settings.rate_limit_write_burst
+        ),
+        "read": BucketPolicy(
+            settings.rate_limit_read_per_minute / 60, settings.rate_limit_read_burst
+        ),
+    }
+
+
+def classify_route(method: str, path: str) -> str | None:
+    """Return the route class for a request, or None if it is not limited."""
+
+    if path == LOGIN_PATH:
+        return "login"
+    if path in EXEMPT_PATHS or path.startswith(EXEMPT_PREFIXES):
+        return None
+    if method in READ_METHODS:
+        return "read"
+    return "write"
+
+
+def trusted_proxy_hops(settings: Settings) -> int:
+    """Return how many ``X-Forwarded-For`` hops to trust (0 ignores the header)."""
+
+    if settings.rate_limit_trust_forwarded_for:
+        return settings.rate_limit_trusted_proxy_hops
+    return 0
+
+
+def client_ip(scope: Scope, trusted_proxy_hops: int = 0) -> str:
+    """Return the client address, optionally honouring ``X-Forwarded-For``.
+
+    Each trusted proxy appends the address it received from, so the client
+    is the entry ``trusted_proxy_hops`` from the right. Entries further left
+    are client-supplied and ignored.
+    """
+
+    if trusted_proxy_hops:
+        forwarded = [
+            entry.strip()
+            for name, value in scope.get("headers", ())
+            if name == b"x-forwarded-for"
+            for entry in value.decode("latin-1").split(",")
+        ]
+        if len(forwarded) >= trusted_proxy_hops:
+            return forwarded[-trusted_proxy_hops]
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _reject(status_code: int, detail: str, retry_after: float) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"detail": detail},
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+class RateLimitMiddleware:
+    """Reject over-limit clients and shed load before any route or DB work runs."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        settings: Settings | None = None,
+        store: BucketStore | None = None,
+    ):
+        settings = settings or get_settings()
+        self.app = app
+        self.enabled = settings.rate_limit_enabled
+        self.trusted_proxy_hops = trusted_proxy_hops(settings)
+        self.max_concurrent_requests = settings.max_concurrent_requests
+        self.policies = build_policies(settings)
+        self.store = store or build_bucket_store(settings)
+        self._in_flight = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        route_class = classify_route(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        if self.max_concurrent_requests and self._in_flight >= self.max_concurrent_requests:
+            response = _reject(503, "Server busy, please retry shortly", 1)
+            await response(scope, receive, send)
+            return
+
+        # Reserve the slot before awaiting the store so concurrent requests
+        # cannot all pass the check above while the store call is pending.
+        self._in_flight += 1
+        key = f"{route_class}:{client_ip(scope, self.trusted_proxy_hops)}"
+        try:
+            wait = await self.store.consume(key, self.policies[route_class])
+        except BaseException:
+            self._in_flight -= 1
+            raise
+
+        if wait > 0:
+            self._in_flight -= 1
+            logger.debug("Rate limit exceeded for %s", key)
+            response = _reject(429, "Too many requests", wait)
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._in_flight -= 1
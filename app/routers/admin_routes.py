@@ -1,17 +1,20 @@
 """Routes for admin authentication and protected actions."""
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app import schemas
+from app.audit import audit_log
 from app.auth.jwt_handler import create_access_token
 from app.config import get_settings
 from app.auth.password import verify_password
 from app.crud.admin_crud import AdminCRUD
+from app.crud.audit_crud import AuditCRUD
 from app.crud.booking_crud import BookingCRUD
-from app.dependencies import get_current_admin, get_db
+from app.dependencies import get_client_address, get_current_admin, get_db
+from app.serialization import orm_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/admin", tags=["Admin"])
@@ -19,16 +22,37 @@ settings = get_settings()
 
 
 @router.post("/login", response_model=schemas.TokenResponse, status_code=status.HTTP_200_OK)
-def login(payload: schemas.AdminLogin, db: Session = Depends(get_db)):
+def login(
+    payload: schemas.AdminLogin,
+    db: Session = Depends(get_db),
+    client_address: str = Depends(get_client_address),
+):
     """Authenticate admin and return JWT token."""
 
     admin = AdminCRUD.get_by_username(db, payload.username)
     if not admin or not verify_password(payload.password, admin.password_hash):
+        # Never store an unmatched username: users often type passwords there.
+        audit_log.record(
+            "admin.login",
+            actor=admin.username if admin else None,
+            client_address=client_address,
+            entity_type="admin" if admin else None,
+            entity_id=admin.id if admin else None,
+            details={"success": False},
+        )
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password",
         )
 
+    audit_log.record(
+        "admin.login",
+        actor=admin.username,
+        client_address=client_address,
+        entity_type="admin",
+        entity_id=admin.id,
+        details={"success": True},
+    )
     token, _ = create_access_token(subject=admin.username)
     return schemas.TokenResponse(
         access_token=token, expires_in_minutes=settings.access_token_expire_minutes
@@ -39,12 +63,15 @@ def login(payload: schemas.AdminLogin, db: Session = Depends(get_db)):
 def cancel_booking(
     booking_id: int,
     db: Session = Depends(get_db),
-    _admin=Depends(get_current_admin),
+    admin=Depends(get_current_admin),
+    client_address: str = Depends(get_client_address),
 ):
     """Cancel/delete booking by ID (admin only)."""
 
     try:
-        deleted = BookingCRUD.delete(db, booking_id)
+        deleted = BookingCRUD.delete(
+            db, booking_id, actor=admin.username, client_address=client_address
+        )
     except SQLAlchemyError as exc:
         logger.exception("Failed to cancel booking", exc_info=exc)
         raise HTTPException(status_code=500, detail="Failed to cancel booking") from exc
@@ -53,3 +80,19 @@ def cancel_booking(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
 
     return {"message": "Booking cancelled successfully"}
+
+
+@router.get("/audit-events", response_model=schemas.AuditEventPage, status_code=status.HTTP_200_OK)
+def list_audit_events(
+    limit: int = Query(50, ge=1, le=500),
+    before_id: int | None = Query(None, ge=1),
+    action: str | None = Query(None, max_length=50),
+    db: Session = Depends(get_db),
+    _admin=Depends(get_current_admin),
+):
+    """List audit events newest first; pass ``next_before_id`` to get the next page."""
+
+    events, next_before_id = AuditCRUD.list_page(db, limit, before_id, action)
+    return orm_response(
+        schemas.AuditEventPage, {"items": events, "next_before_id": next_before_id}
+    )
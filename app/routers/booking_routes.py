@@ -9,14 +9,19 @@ from sqlalchemy.orm import Session
 from app import schemas
 from app.crud.booking_crud import BookingCRUD
 from app.crud.sponsor_crud import SponsorCRUD
-from app.dependencies import get_db
+from app.dependencies import get_client_address, get_db
+from app.serialization import json_response, orm_response, schedule_adapter
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
 
 @router.post("", response_model=schemas.BookingRead, status_code=status.HTTP_201_CREATED)
-def create_booking(payload: schemas.BookingCreate, db: Session = Depends(get_db)):
+def create_booking(
+    payload: schemas.BookingCreate,
+    db: Session = Depends(get_db),
+    client_address: str = Depends(get_client_address),
+):
     """Create a booking."""
 
     if payload.booking_date <= date.today():
@@ -39,7 +44,7 @@ def create_booking(payload: schemas.BookingCreate, db: Session = Depends(get_db)
         )
 
     try:
-        return BookingCRUD.create(db, payload)
+        booking = BookingCRUD.create(db, payload, client_address=client_address)
     except IntegrityError as exc:
         logger.warning("Duplicate booking date attempted: %s", payload.booking_date)
         raise HTTPException(
@@ -50,6 +55,8 @@ def create_booking(payload: schemas.BookingCreate, db: Session = Depends(get_db)
         logger.exception("Failed to create booking", exc_info=exc)
         raise HTTPException(status_code=500, detail="Failed to create booking") from exc
 
+    return orm_response(schemas.BookingRead, booking, status.HTTP_201_CREATED)
+
 
 @router.get("", response_model=list[schemas.BookingScheduleItem], status_code=status.HTTP_200_OK)
 def get_monthly_schedule(
@@ -59,4 +66,5 @@ def get_monthly_schedule(
 ):
     """Get monthly booking schedule."""
 
-    return BookingCRUD.get_monthly_schedule(db, month, year)
+    rows = BookingCRUD.get_monthly_schedule(db, month, year)
+    return json_response(schedule_adapter, rows)
@@ -7,18 +7,25 @@ from sqlalchemy.orm import Session
 
 from app import schemas
 from app.crud.sponsor_crud import SponsorCRUD
-from app.dependencies import get_db
+from app.dependencies import get_client_address, get_db
+from app.serialization import orm_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/sponsors", tags=["Sponsors"])
 
 
 @router.post("", response_model=schemas.SponsorRead, status_code=status.HTTP_201_CREATED)
-def create_sponsor(payload: schemas.SponsorCreate, db: Session = Depends(get_db)):
+def create_sponsor(
+    payload: schemas.SponsorCreate,
+    db: Session = Depends(get_db),
+    client_address: str = Depends(get_client_address),
+):
     """Register a sponsor."""
 
     try:
-        return SponsorCRUD.create(db, payload)
+        sponsor = SponsorCRUD.create(db, payload, client_address=client_address)
     except SQLAlchemyError as exc:
         logger.exception("Failed to create sponsor", exc_info=exc)
         raise HTTPException(status_code=500, detail="Failed to create sponsor") from exc
+
+    return orm_response(schemas.SponsorRead, sponsor, status.HTTP_201_CREATED)
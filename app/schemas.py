@@ -2,6 +2,7 @@
 from datetime import date, datetime
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from typing_extensions import TypedDict
 
 
 class SponsorBase(BaseModel):
@@ -55,6 +56,15 @@ class BookingScheduleItem(BaseModel):
     status: str
 
 
+class BookingScheduleRow(TypedDict):
+    """Plain-dict schedule entry, serialised without model construction."""
+
+    booking_date: date
+    sponsor_name: str
+    food_note: str | None
+    status: str
+
+
 class AdminLogin(BaseModel):
     """Admin login request."""
 
@@ -68,3 +78,25 @@ class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
     expires_in_minutes: int
+
+
+class AuditEventRead(BaseModel):
+    """Schema for returning audit event."""
+
+    id: int
+    action: str
+    actor: str | None
+    client_address: str | None
+    entity_type: str | None
+    entity_id: int | None
+    details: dict | None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AuditEventPage(BaseModel):
+    """Keyset-paginated page of audit events, newest first."""
+
+    items: list[AuditEventRead]
+    next_before_id: int | None
@@ -0,0 +1,37 @@
+"""Compiled JSON encoders that bypass FastAPI's response-model round trip.
+
+Returning a ``Response`` directly skips FastAPI's validate-then-serialise
+pass over ``response_model``; routes keep ``response_model`` for OpenAPI.
+"""
+from typing import Any
+
+from fastapi import Response, status
+from pydantic import BaseModel, TypeAdapter
+
+from app import schemas
+
+schedule_adapter = TypeAdapter(list[schemas.BookingScheduleRow])
+
+
+def json_response(
+    adapter: TypeAdapter, content: Any, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Encode ``content`` with a compiled adapter, without validating it."""
+
+    return Response(
+        content=adapter.dump_json(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def orm_response(
+    schema: type[BaseModel], obj: Any, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Validate an ORM object once against ``schema`` and encode it."""
+
+    return Response(
+        content=schema.model_validate(obj).model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -0,0 +1,54 @@
+"""Microbenchmark of schedule serialisation cost per row."""
+import argparse
+import timeit
+from datetime import date, timedelta
+
+from pydantic import TypeAdapter
+
+from app import schemas
+from app.serialization import schedule_adapter
+
+legacy_adapter = TypeAdapter(list[schemas.BookingScheduleItem])
+
+
+def make_rows(days: int) -> list[schemas.BookingScheduleRow]:
+    start = date(2026, 1, 1)
+    return [
+        {
+            "booking_date": start + timedelta(days=offset),
+            "sponsor_name": f"Sponsor {offset}",
+            "food_note": "Biryani" if offset % 2 else None,
+            "status": "booked",
+        }
+        for offset in range(days)
+    ]
+
+
+def legacy_path(rows: list[schemas.BookingScheduleRow]) -> bytes:
+    """Model per row in CRUD, then FastAPI's dump/validate/serialise pass."""
+
+    items = [schemas.BookingScheduleItem(**row) for row in rows]
+    value = legacy_adapter.validate_python([item.model_dump() for item in items])
+    return legacy_adapter.dump_json(value)
+
+
+def fast_path(rows: list[schemas.BookingScheduleRow]) -> bytes:
+    return schedule_adapter.dump_json(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark schedule serialisation")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    for label, days in (("month", 31), ("5 years", 5 * 365)):
+        rows = make_rows(days)
+        assert legacy_path(rows) == fast_path(rows)
+        for name, func in (("legacy", legacy_path), ("fast", fast_path)):
+            seconds = min(timeit.repeat(lambda: func(rows), number=args.repeat, repeat=3))
+            per_row_us = seconds / args.repeat / days * 1_000_000
+            print(f"{label:>8} | {name:<6} | {per_row_us:7.3f} us/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""Shared pytest setup."""
+import os
+
+# app.database builds its engine at import time; keep tests off PostgreSQL.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
@@ -0,0 +1,215 @@
+"""Tests for the batched audit writer and audit event pagination."""
+import time
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import models
+from app.audit import AuditLog
+from app.config import Settings
+from app.crud.audit_crud import AuditCRUD
+from app.database import Base
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def make_log(session_factory, batch_size=100, flush_interval=60.0, max_queue_size=100):
+    return AuditLog(
+        session_factory,
+        max_queue_size=max_queue_size,
+        batch_size=batch_size,
+        flush_interval=flush_interval,
+    )
+
+
+def actions(session_factory) -> list[str]:
+    with session_factory() as db:
+        stmt = select(models.AuditEvent.action).order_by(models.AuditEvent.id)
+        return list(db.execute(stmt).scalars())
+
+
+def wait_for_rows(session_factory, count: int, timeout: float = 2.0) -> list[str]:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        rows = actions(session_factory)
+        if len(rows) >= count:
+            return rows
+        time.sleep(0.02)
+    return actions(session_factory)
+
+
+def test_flushes_when_batch_is_full(session_factory):
+    log = make_log(session_factory, batch_size=3)
+    log.start()
+    try:
+        for action in ("a", "b", "c"):
+            log.record(action)
+        assert wait_for_rows(session_factory, 3) == ["a", "b", "c"]
+    finally:
+        log.stop(timeout=5)
+
+
+def test_flushes_after_interval(session_factory):
+    log = make_log(session_factory, flush_interval=0.05)
+    log.start()
+    try:
+        log.record("a")
+        assert wait_for_rows(session_factory, 1) == ["a"]
+    finally:
+        log.stop(timeout=5)
+
+
+def test_stop_drains_queue(session_factory):
+    log = make_log(session_factory, batch_size=2)
+    for index in range(5):
+        log.record(f"event.{index}")
+
+    log.start()
+    log.stop(timeout=5)
+
+    assert len(actions(session_factory)) == 5
+
+
+def test_bad_row_only_drops_itself(session_factory):
+    log = make_log(session_factory)
+    log.record("good.1")
+    log.record("bad", details={"value": object()})
+    log.record("good.2")
+
+    log.start()
+    log.stop(timeout=5)
+
+    assert actions(session_factory) == ["good.1", "good.2"]
+
+
+def test_record_truncates_oversized_values(session_factory):
+    log = make_log(session_factory)
+    log.record("admin.login", actor="x" * 500)
+
+    log.start()
+    log.stop(timeout=5)
+
+    with session_factory() as db:
+        assert len(db.execute(select(models.AuditEvent.actor)).scalar_one()) == 100
+
+
+def test_connection_errors_retry_the_batch(session_factory, monkeypatch):
+    bulk_create = AuditCRUD.bulk_create
+    calls = []
+
+    def flaky_bulk_create(db, events):
+        calls.append(len(events))
+        if len(calls) == 1:
+            raise OperationalError("INSERT", {}, Exception("connection refused"))
+        bulk_create(db, events)
+
+    monkeypatch.setattr(AuditCRUD, "bulk_create", staticmethod(flaky_bulk_create))
+    log = make_log(session_factory, batch_size=2, flush_interval=0.05)
+    log.start()
+    try:
+        log.record("a")
+        log.record("b")
+        assert wait_for_rows(session_factory, 2) == ["a", "b"]
+    finally:
+        log.stop(timeout=5)
+
+    # The whole batch was retried, not split into single-row inserts.
+    assert calls == [2, 2]
+
+
+def test_writer_survives_unexpected_errors(session_factory):
+    failures = iter([RuntimeError("boom")])
+
+    def factory():
+        error = next(failures, None)
+        if error:
+            raise error
+        return session_factory()
+
+    log = make_log(factory, batch_size=1, flush_interval=0.05)
+    log.start()
+    try:
+        log.record("lost")
+        time.sleep(0.2)
+        log.record("kept")
+        assert wait_for_rows(session_factory, 1) == ["kept"]
+        assert log._thread.is_alive()
+    finally:
+        log.stop(timeout=5)
+
+
+def test_full_queue_counts_dropped_events(session_factory):
+    log = make_log(session_factory, max_queue_size=1)
+    log.record("a")
+    log.record("b")
+
+    assert log._dropped == 1
+    log.start()
+    log.stop(timeout=5)
+    assert log._dropped == 0
+    assert actions(session_factory) == ["a"]
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"audit_queue_size": 0},
+        {"audit_batch_size": 0},
+        {"audit_flush_interval_seconds": 0},
+        {"audit_shutdown_timeout_seconds": 0},
+    ],
+)
+def test_settings_reject_non_positive_audit_values(overrides):
+    with pytest.raises(ValidationError):
+        Settings(**overrides)
+
+
+@pytest.fixture
+def five_events(session_factory):
+    now = datetime.now(timezone.utc)
+    with session_factory() as db:
+        AuditCRUD.bulk_create(
+            db,
+            [
+                {"action": "booking.create" if i % 2 else "admin.login", "created_at": now}
+                for i in range(1, 6)
+            ],
+        )
+    return session_factory
+
+
+def page_ids(db, limit, before_id=None, action=None):
+    events, next_before_id = AuditCRUD.list_page(db, limit, before_id, action)
+    return [event.id for event in events], next_before_id
+
+
+def test_list_page_walks_newest_first(five_events):
+    with five_events() as db:
+        assert page_ids(db, 2) == ([5, 4], 4)
+        assert page_ids(db, 2, before_id=4) == ([3, 2], 2)
+        assert page_ids(db, 2, before_id=2) == ([1], None)
+
+
+def test_list_page_exact_fit_has_no_next_page(five_events):
+    with five_events() as db:
+        assert page_ids(db, 5) == ([5, 4, 3, 2, 1], None)
+        assert page_ids(db, 2, before_id=1) == ([], None)
+
+
+def test_list_page_filters_by_action(five_events):
+    with five_events() as db:
+        assert page_ids(db, 2, action="booking.create") == ([5, 3], 3)
+        assert page_ids(db, 2, before_id=3, action="booking.create") == ([1], None)
@@ -0,0 +1,97 @@
+"""Tests for token-bucket storage and client address resolution."""
+import asyncio
+
+import pytest
+
+from app import rate_limit
+from app.rate_limit import BucketPolicy, MemoryBucketStore, client_ip
+
+POLICY = BucketPolicy(rate_per_second=1.0, capacity=3)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", fake)
+    return fake
+
+
+def consume(store: MemoryBucketStore, key: str, policy: BucketPolicy = POLICY) -> float:
+    return asyncio.run(store.consume(key, policy))
+
+
+def test_memory_store_allows_burst_then_rejects(clock):
+    store = MemoryBucketStore(max_buckets=10)
+
+    assert [consume(store, "a") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert consume(store, "a") == pytest.approx(1.0)
+
+
+def test_memory_store_refills_over_time(clock):
+    store = MemoryBucketStore(max_buckets=10)
+    for _ in range(3):
+        consume(store, "a")
+
+    clock.now += 0.5
+    assert consume(store, "a") == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert consume(store, "a") == 0.0
+
+
+def test_memory_store_refill_is_capped_at_capacity(clock):
+    store = MemoryBucketStore(max_buckets=10)
+    consume(store, "a")
+
+    clock.now += 3600
+    assert [consume(store, "a") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert consume(store, "a") > 0
+
+
+def test_memory_store_evicts_least_recently_used(clock):
+    store = MemoryBucketStore(max_buckets=2)
+    for _ in range(3):
+        consume(store, "a")
+    consume(store, "b")
+    consume(store, "a")  # touch "a" so "b" is the oldest
+    consume(store, "c")
+
+    assert len(store._buckets) == 2
+    assert "b" not in store._buckets
+    assert consume(store, "a") > 0
+
+
+def scope_with(*forwarded: bytes, client=("10.0.0.9", 1234)) -> dict:
+    return {
+        "headers": [(b"x-forwarded-for", value) for value in forwarded],
+        "client": client,
+    }
+
+
+def test_client_ip_ignores_header_without_trusted_hops():
+    assert client_ip(scope_with(b"1.1.1.1"), 0) == "10.0.0.9"
+
+
+def test_client_ip_uses_rightmost_entry_for_one_hop():
+    scope = scope_with(b"6.6.6.6, 1.1.1.1")
+
+    assert client_ip(scope, 1) == "1.1.1.1"
+
+
+def test_client_ip_skips_trusted_hops_across_headers():
+    scope = scope_with(b"6.6.6.6, 1.1.1.1", b"2.2.2.2")
+
+    assert client_ip(scope, 2) == "1.1.1.1"
+
+
+def test_client_ip_falls_back_when_header_is_too_short():
+    assert client_ip(scope_with(b"1.1.1.1"), 2) == "10.0.0.9"
+    assert client_ip(scope_with(client=None), 1) == "unknown"